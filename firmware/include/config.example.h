@@ -17,6 +17,10 @@ static const char* DEVICE_ID = "airq-d1mini-01";
 // Sampling
 static const uint32_t SAMPLE_MS = 2000;
 
+// Cloud storage: readings are queued and POSTed to the worker as one JSON array.
+// Optional; main.cpp defaults to 5 readings per POST when this is not defined
+// #define AIRQ_POST_BATCH_SIZE 5
+
 // NeoPixel shield
 static const uint8_t PIN_NEOPIXEL = D4;   // common default for D1 mini shields
 static const uint16_t N_LEDS = 1;
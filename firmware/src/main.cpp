@@ -33,6 +33,20 @@ Adafruit_SHT31 sht31 = Adafruit_SHT31();
 static uint32_t bootMs = 0;
 static uint32_t lastSample = 0;
 
+// Readings per worker POST (one TLS handshake per batch instead of per sample).
+// Defaults here so existing config.h files keep building; a device may
+// #define AIRQ_POST_BATCH_SIZE in its config.h to override it
+#ifndef AIRQ_POST_BATCH_SIZE
+#define AIRQ_POST_BATCH_SIZE 5
+#endif
+
+// Longest JSON payload for one reading, including the terminating NUL
+static const size_t JSON_MAX = 256;
+
+// Pending worker POST body: an open JSON array ("[" + comma-separated readings)
+static String postBatch;
+static uint8_t postBatchCount = 0;
+
 // Apply brightness cap and update first pixel (assumes at least 1 LED)
 static void setLed(uint32_t c) {
   leds.setBrightness(LED_BRIGHTNESS);
@@ -123,6 +137,14 @@ static uint32_t absoluteHumidity_mgm3(float tempC, float rh) {
   return (uint32_t)(ah * 1000.0f);
 }
 
+// Format a reading for JSON with 2 decimals; NaN (sensor missing or read failed)
+// becomes null so the payload stays valid JSON
+static const char* jsonFloat(char* buf, size_t len, float v) {
+  if (isnan(v)) return "null";
+  snprintf(buf, len, "%.2f", v);
+  return buf;
+}
+
 static void wifiConnect() {
   Serial.print("Connecting to WiFi: ");
   Serial.println(WIFI_SSID);
@@ -168,7 +190,7 @@ static void mqttConnect() {
 }
 
 // Publish JSON to HiveMQ
-static bool publishToMQTT(const String& json) {
+static bool publishToMQTT(const char* json) {
   if (WiFi.status() != WL_CONNECTED) {
     Serial.println("[MQTT] WiFi not connected");
     return false;
@@ -182,7 +204,7 @@ static bool publishToMQTT(const String& json) {
   }
 
   Serial.print("[MQTT] Publishing to " + String(MQTT_TOPIC) + "... ");
-  bool ok = mqttPub->publish(json.c_str());
+  bool ok = mqttPub->publish(json);
   if (ok) {
     Serial.println("✓");
   } else {
@@ -205,7 +227,7 @@ static bool postToWorker(const String& json) {
     return false;
   }
 
-  String post = String("POST /api/store HTTP/1.1\r\n") +
+  String post = String("POST /api/ingest HTTP/1.1\r\n") +
                 "Host: airq-5xv.pages.dev\r\n" +
                 "Content-Type: application/json\r\n" +
                 "Content-Length: " + json.length() + "\r\n" +
@@ -252,6 +274,11 @@ void setup() {
 
   if (sgpOk) sgp.IAQinit(); //Start internal air-quality algorithm and baseline tracking.
 
+  // One allocation up front: room for a full batch of maximum-size readings,
+  // separators and brackets, so queueing and closing the array never regrow it
+  postBatch.reserve(AIRQ_POST_BATCH_SIZE * JSON_MAX + 2);
+  postBatch = "[";
+
   wifiConnect();
 }
 
@@ -267,7 +294,10 @@ void loop() {
 
   // Sample cadence (SGP30 IAQ wants ~1 Hz; keep SAMPLE_MS around 1000 in config.h)
   if (now - lastSample >= SAMPLE_MS) {
-    lastSample = now;
+    // Advance on a fixed SAMPLE_MS grid so time spent in MQTT/HTTPS calls doesn't
+    // accumulate as drift; if a whole period was missed, resync instead of bursting
+    lastSample += SAMPLE_MS;
+    if (now - lastSample >= SAMPLE_MS) lastSample = now;
 
     //Defensive initialization
     float tC = NAN;
@@ -311,21 +341,42 @@ uint16_t idx = tvocToIndex(tvoc);
 
 setLed(ledColor);
 
-// Build a JSON payload manually (kept small to reduce heap usage on ESP8266)
-String json = "{";
-json += "\"ts_ms\":" + String(now) + ",";                 // Time since boot (ms)
-json += "\"device_id\":\"" + String(DEVICE_ID) + "\",";   // Device ID
-json += "\"t_c\":" + String(tC, 2) + ",";                 // Temp (°C)
-json += "\"rh\":" + String(rh, 2) + ",";                  // Humidity (%)
-json += "\"tvoc_ppb\":" + String(tvoc) + ",";             // TVOC (ppb)
-json += "\"eco2_ppm\":" + String(eco2) + ",";             // eCO2 (ppm)
-json += "\"aq_index\":" + String(idx) + ",";              // AQ index (0–100)
-json += "\"warming_up\":" + String(warmingUp ? "true" : "false"); // Warmup flag
-json += "}";  // End JSON
+// Build the JSON payload in one snprintf into a stack buffer: no String temporaries,
+// so nothing is allocated on the ESP8266 heap per sample
+char tBuf[16];
+char rhBuf[16];
+char json[JSON_MAX];
+int jsonLen = snprintf(json, sizeof(json),
+                       "{\"ts_ms\":%lu,"          // Time since boot (ms)
+                       "\"device_id\":\"%s\","   // Device ID
+                       "\"t_c\":%s,"              // Temp (°C)
+                       "\"rh\":%s,"               // Humidity (%)
+                       "\"tvoc_ppb\":%u,"         // TVOC (ppb)
+                       "\"eco2_ppm\":%u,"         // eCO2 (ppm)
+                       "\"aq_index\":%u,"         // AQ index (0–100)
+                       "\"warming_up\":%s}",      // Warmup flag
+                       (unsigned long)now, DEVICE_ID,
+                       jsonFloat(tBuf, sizeof(tBuf), tC), jsonFloat(rhBuf, sizeof(rhBuf), rh),
+                       tvoc, eco2, idx,
+                       warmingUp ? "true" : "false");
+if (jsonLen < 0 || (size_t)jsonLen >= sizeof(json)) {
+  // Truncated output would be invalid JSON (e.g. DEVICE_ID too long): publish nothing
+  Serial.println("{\"error\":\"JSON payload too long\"}");
+  return;
+}
 
 Serial.println(json);      // Serial log
 (void)publishToMQTT(json);    // HiveMQ MQTT publication (best-effort)
-(void)postToWorker(json);     // Cloudflare Worker for D1 storage (best-effort)
+
+// Cloudflare Worker for D1 storage (best-effort): queue and send as one batch
+if (postBatchCount > 0) postBatch += ",";
+postBatch += json;
+if (++postBatchCount >= AIRQ_POST_BATCH_SIZE) {
+  postBatch += "]";
+  (void)postToWorker(postBatch);
+  postBatch = "[";
+  postBatchCount = 0;
+}
 
   }
 }
@@ -1,8 +1,12 @@
 /**
  * Cloudflare Worker: AirQ Data Aggregation & Storage
+ *
+ * Not part of the Pages deploy: .github/workflows/deploy.yml publishes only
+ * web/public and web/functions, where web/functions/api/ingest.js receives
+ * firmware readings. This worker must be deployed separately to be reachable.
  * 
  * Endpoints:
- * POST   /api/readings   - Receive 5s readings, aggregate to 30min, store in D1
+ * POST   /api/readings   - Receive readings (single or batched), aggregate to 30min, store in D1
  * GET    /api/history    - Retrieve historical 30-minute aggregates
  */
 
@@ -24,49 +28,59 @@ function getBucketTimestamp(date = new Date()) {
 // POST /api/readings - Receive reading and aggregate
 router.post('/api/readings', async (request, env) => {
   try {
-    const reading = await request.json();
-    
-    if (!reading.ts_ms || reading.aq_index === undefined) {
+    const body = await request.json();
+    // A single reading or an array of readings, same contract as web/functions/api/ingest.js
+    const readings = Array.isArray(body) ? body : [body];
+
+    if (readings.length === 0 ||
+        readings.some(reading => !reading || !reading.ts_ms || reading.aq_index === undefined)) {
       return new Response(
         JSON.stringify({ error: 'Missing ts_ms or aq_index' }),
         { status: 400 }
       );
     }
 
-    const readingDate = new Date(reading.ts_ms);
-    const bucketKey = getBucketTimestamp(readingDate);
-    const deviceId = reading.device_id || 'airq-d1mini-01';
+    let bucketKey = null;
+    let bucket = null;
+    let readingDate = null;
+
+    for (const reading of readings) {
+      readingDate = new Date(reading.ts_ms);
+      bucketKey = getBucketTimestamp(readingDate);
+      const deviceId = reading.device_id || 'airq-d1mini-01';
+
+      // Get or initialize bucket (running sums: fixed size regardless of sample count)
+      if (!readingBuffer.has(bucketKey)) {
+        readingBuffer.set(bucketKey, {
+          device_id: deviceId,
+          aq_index: 0,
+          tvoc_ppb: 0,
+          eco2_ppm: 0,
+          temp_c: 0,
+          rh: 0,
+          count: 0
+        });
+      }
 
-    // Get or initialize bucket
-    if (!readingBuffer.has(bucketKey)) {
-      readingBuffer.set(bucketKey, {
-        device_id: deviceId,
-        aq_index: [],
-        tvoc_ppb: [],
-        eco2_ppm: [],
-        temp_c: [],
-        rh: [],
-        count: 0
-      });
+      bucket = readingBuffer.get(bucketKey);
+      bucket.aq_index += reading.aq_index;
+      bucket.tvoc_ppb += reading.tvoc_ppb || 0;
+      bucket.eco2_ppm += reading.eco2_ppm || 400;
+      bucket.temp_c += reading.t_c || 0;
+      bucket.rh += reading.rh || 0;
+      bucket.count++;
     }
 
-    const bucket = readingBuffer.get(bucketKey);
-    bucket.aq_index.push(reading.aq_index);
-    bucket.tvoc_ppb.push(reading.tvoc_ppb || 0);
-    bucket.eco2_ppm.push(reading.eco2_ppm || 400);
-    bucket.temp_c.push(reading.t_c || 0);
-    bucket.rh.push(reading.rh || 0);
-    bucket.count++;
-
-    // Check if previous bucket is complete (30 min passed) and save it
-    const allBuckets = Array.from(readingBuffer.keys()).sort();
-    for (const oldBucket of allBuckets) {
+    // Check if previous bucket is complete (30 min passed) and save it.
+    // Map iteration follows insertion order, which is already chronological for
+    // the device's append-only stream, so no per-request key copy + sort is needed.
+    for (const [oldBucket, oldData] of readingBuffer) {
       const oldBucketDate = new Date(oldBucket);
       const timeDiff = readingDate - oldBucketDate;
 
       // If difference > 30 minutes and bucket is not current, save it
       if (timeDiff > 30 * 60 * 1000 && oldBucket !== bucketKey) {
-        await saveBucketToD1(env, oldBucket, readingBuffer.get(oldBucket));
+        await saveBucketToD1(env, oldBucket, oldData);
         readingBuffer.delete(oldBucket);
       }
     }
@@ -75,7 +89,8 @@ router.post('/api/readings', async (request, env) => {
       JSON.stringify({
         success: true,
         bucket: bucketKey,
-        samples_in_bucket: bucket.count
+        samples_received: readings.length,
+        samples_in_bucket: bucket ? bucket.count : 0
       }),
       { status: 200 }
     );
@@ -131,8 +146,8 @@ async function saveBucketToD1(env, timestamp, bucket) {
   try {
     const db = env.DB;
 
-    // Calculate averages
-    const avg = (arr) => arr.reduce((a, b) => a + b, 0) / arr.length;
+    // Calculate averages from the bucket's running sums
+    const avg = (sum) => sum / bucket.count;
 
     const values = {
       timestamp: timestamp,
@@ -3,38 +3,45 @@
 
 export async function onRequestPost(context) {
   try {
-    const data = await context.request.json();
-    
+    const body = await context.request.json();
+    // Firmware posts readings in batches (JSON array); a single object is still accepted
+    const readings = Array.isArray(body) ? body : [body];
+
     // Basic validation
-    if (!data.device_id || typeof data.tvoc_ppb === 'undefined') {
+    if (readings.length === 0 ||
+        readings.some(data => !data || !data.device_id || typeof data.tvoc_ppb === 'undefined')) {
       return new Response(JSON.stringify({ error: "Missing required fields" }), {
         status: 400,
         headers: { "Content-Type": "application/json" }
       });
     }
 
-    // Save to D1 database
+    // Save to D1 database (one round trip for the whole batch)
     if (context.env.DB) {
-      await context.env.DB.prepare(
+      const insert = context.env.DB.prepare(
         `INSERT INTO readings (device_id, ts_ms, temperature, humidity, tvoc_ppb, eco2_ppm, aq_index, warming_up)
          VALUES (?, ?, ?, ?, ?, ?, ?, ?)`
-      ).bind(
+      );
+      await context.env.DB.batch(readings.map(data => insert.bind(
         data.device_id,
         data.ts_ms,
-        data.t_c || null,
-        data.rh || null,
+        // ?? (not ||) so legitimate zero readings are stored instead of becoming NULL
+        data.t_c ?? null,
+        data.rh ?? null,
         data.tvoc_ppb,
-        data.eco2_ppm || null,
-        data.aq_index || null,
+        data.eco2_ppm ?? null,
+        data.aq_index ?? null,
         data.warming_up ? 1 : 0
-      ).run();
+      )));
     }
 
-    console.log(`[${data.device_id}] TVOC=${data.tvoc_ppb}ppb AQ=${data.aq_index}`);
+    const last = readings[readings.length - 1];
+    console.log(`[${last.device_id}] ${readings.length} reading(s), last TVOC=${last.tvoc_ppb}ppb AQ=${last.aq_index}`);
 
     return new Response(JSON.stringify({ 
       success: true,
-      device_id: data.device_id
+      device_id: last.device_id,
+      count: readings.length
     }), {
       status: 200,
       headers: { "Content-Type": "application/json" }
@@ -1,4 +1,5 @@
 // Get recent readings from last hour
+// (currently has no caller: the dashboard gets live data over MQTT and history from /api/history)
 export async function onRequestGet(context) {
   try {
     if (!context.env.DB) {
@@ -8,25 +9,20 @@ export async function onRequestGet(context) {
       });
     }
 
-    // Get readings from last hour
-    const { results } = await context.env.DB.prepare(
-      `SELECT device_id, ts_ms, temperature, humidity, tvoc_ppb, eco2_ppm, aq_index, warming_up, created_at
+    // Get readings from last hour, with columns aliased to the firmware JSON
+    // field names so D1 rows can be returned without rebuilding each object
+    const { results: readings } = await context.env.DB.prepare(
+      `SELECT ts_ms, device_id, temperature AS t_c, humidity AS rh,
+              tvoc_ppb, eco2_ppm, aq_index, warming_up
        FROM readings
        WHERE created_at >= datetime('now', '-1 hour')
        ORDER BY created_at ASC`
     ).all();
 
-    // Transform to match firmware JSON format
-    const readings = results.map(r => ({
-      ts_ms: r.ts_ms,
-      device_id: r.device_id,
-      t_c: r.temperature,
-      rh: r.humidity,
-      tvoc_ppb: r.tvoc_ppb,
-      eco2_ppm: r.eco2_ppm,
-      aq_index: r.aq_index,
-      warming_up: r.warming_up === 1
-    }));
+    // SQLite has no boolean type: restore the firmware's true/false in place
+    for (const r of readings) {
+      r.warming_up = r.warming_up === 1;
+    }
 
     return new Response(JSON.stringify(readings), {
       headers: { 